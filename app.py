@@ -1,11 +1,108 @@
 import streamlit as st
+import numpy as np
 import math
-from datetime import datetime
+import bisect
+import html
+from types import MappingProxyType
+from pathlib import Path
 import logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+@st.cache_resource(show_spinner=False)
+def _logger():
+    """Configure logging once per server process and return the app logger"""
+    if not logging.getLogger().handlers:
+        logging.basicConfig(level=logging.INFO)
+    return logging.getLogger(__name__)
+
+# Streamlit page configuration
+_PAGE_CONFIG = dict(
+    page_title="Tri-Framework Oracle - Trading Mastery",
+    page_icon="🔮",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# Static sidebar text below the outcome selector, sent as a single element
+_SIDEBAR_MD = """
+---
+
+**Example Setup:**
+
+- Odds: 2.0, 3.0, 4.0
+- Bankroll: £100
+- Expected: Arbitrage found!
+
+---
+
+*Personal Learning Tool*
+
+For educational purposes only
+"""
+
+# Static body of the "Framework Information" expander
+_FRAMEWORK_INFO_MD = """
+**TRI-FRAMEWORK OVERVIEW:**
+
+1. **TREND (AETOS PROTOCOL)**: Price > MA50 for bullish, else bearish
+2. **POSITIONING (PRESSURE GAUGE)**: (Long OI - Short OI) / Total OI
+3. **EXECUTION**: Monitor funding rates and market structure
+
+**PRESSURE GAUGE INTERPRETATION:**
+- > 0.7: EXTREME LONGS (potential bearish squeeze)
+- < -0.7: EXTREME SHORTS (potential bullish squeeze)  
+- 0.2 to 0.7: HIGH LONGS (caution)
+- -0.7 to -0.2: HIGH SHORTS (caution)
+- -0.2 to 0.2: BALANCED positioning
+
+**ALPHA COMPRESSION SPRING:**
+When price compresses in tight range with extreme positioning, 
+a break often triggers a squeeze in the opposite direction.
+
+**FIBONACCI LEVELS:**
+- 23.6%, 38.2%, 50%, 61.8%, 78.6% - Key support/resistance levels
+- Price often reverses at these levels
+- Multi-timeframe alignment increases probability
+
+**DMI (Directional Movement Index):**
+- PDI: Positive Directional Indicator (uptrend strength)
+- MDI: Negative Directional Indicator (downtrend strength)
+- Higher PDI than MDI = Bullish trend strength
+- Higher MDI than PDI = Bearish trend strength
+
+**RSI (Relative Strength Index):**
+- Overbought: RSI > 70 (potential reversal down)
+- Oversold: RSI < 30 (potential reversal up)
+- Neutral: 30-70 (balanced market)
+
+**VOLUME ANALYSIS:**
+- Volume vs MA50: Compare current volume to average
+- Volume Delta: Trend of increasing/decreasing volume
+- VWAP: Institutional level identification
+- High volume with price action = stronger signals
+"""
+
+# Technical indicator panels
+_DMI_BULLISH_TMPL = '<div class="indicator-bullish"><h4>🟢 BULLISH TREND STRENGTH</h4><p>PDI ({pdi:.2f}) significantly stronger than MDI ({mdi:.2f})</p></div>'
+_DMI_BEARISH_TMPL = '<div class="indicator-bearish"><h4>🔴 BEARISH TREND STRENGTH</h4><p>MDI ({mdi:.2f}) significantly stronger than PDI ({pdi:.2f})</p></div>'
+_DMI_NEUTRAL_TMPL = '<div class="indicator-neutral"><h4>🟡 NEUTRAL TREND STRENGTH</h4><p>PDI ({pdi:.2f}) and MDI ({mdi:.2f}) are balanced</p></div>'
+_RSI_OVERBOUGHT_TMPL = '<div class="indicator-bearish"><h4>🔴 OVERBOUGHT ({rsi:.2f})</h4><p>Potential for reversal down</p></div>'
+_RSI_OVERSOLD_TMPL = '<div class="indicator-bullish"><h4>🟢 OVERSOLD ({rsi:.2f})</h4><p>Potential for reversal up</p></div>'
+_RSI_NEUTRAL_TMPL = '<div class="indicator-neutral"><h4>🟡 NEUTRAL ({rsi:.2f})</h4><p>Market in balanced state</p></div>'
+
+# Volume status panels; any other status falls back to the average panel
+_VOLUME_AVERAGE_TMPL = '<div class="volume-neutral"><h4>⚖️ AVERAGE VOLUME ({status})</h4><p>Normal market activity</p></div>'
+_VOLUME_PANELS = {
+    "HIGH": '<div class="volume-high"><h4>📈 HIGH VOLUME ({status})</h4><p>Significant market interest, potential for trend continuation</p></div>',
+    "LOW": '<div class="volume-low"><h4>📉 LOW VOLUME ({status})</h4><p>Low market interest, potential for consolidation</p></div>'
+}
+
+# Outcome labels, indexed by outcome position
+_OUTCOME_LETTERS = "ABCDEFG"
+
+# Arbitrage result panels
+_ARB_ERROR_TMPL = '<div class="error-container"><strong>Error:</strong> {msg}</div>'
+_ARB_FOUND_HTML = '<div class="success-container"><h3>✅ ARBITRAGE OPPORTUNITY FOUND!</h3></div>'
+_NO_ARB_TMPL = '<div class="error-container"><h3>❌ NO ARBITRAGE FOUND</h3><p>Total Implied Probability: {p:.2%}</p></div>'
 
 def calculate_implied_probability(decimal_odds):
     """Calculate implied probability from decimal odds"""
@@ -15,65 +112,95 @@ def calculate_implied_probability(decimal_odds):
 
 def calculate_total_implied_probability(implied_probs):
     """Calculate total implied probability"""
-    return sum(implied_probs)
+    return math.fsum(implied_probs)
 
 def calculate_stakes(bankroll, implied_probs, total_implied):
     """Calculate stakes for each outcome"""
-    stakes = []
-    for prob in implied_probs:
-        stake = (bankroll * prob) / total_implied
-        stakes.append(stake)
-    return stakes
+    return (bankroll * np.asarray(implied_probs, dtype=np.float64) / total_implied).tolist()
 
 def calculate_profit(stake, odds):
-    """Calculate profit from a single bet"""
-    return (stake * odds) - sum([s for s in calculate_stakes(stake, [1/odds], 1/odds)])
+    """Calculate profit from a single winning bet at decimal odds: stake * (odds - 1)"""
+    return stake * (odds - 1.0)
 
 def validate_positive_number(value):
-    """Validate that input is a positive number"""
-    return value and value > 0
+    """Validate that input is a finite positive number"""
+    return value and value > 0 and math.isfinite(value)
+
+# Pressure gauge interpretation panels, indexed by bisecting |gauge| against
+# _PG_LEVELS: balanced (<= 0.2), high (<= 0.5), extreme (> 0.5)
+_PG_LEVELS = (0.2, 0.5)
+_PG_LONG_PANELS = (
+    '<div class="neutral-container"><h4>⚪️ BALANCED ({p:.1%})</h4><p>Positioning appears neutral</p></div>',
+    '<div class="pressure-high-container"><h4>🟡 HIGH LONGS ({a:.1%})</h4><p>Caution - longs may be crowded</p></div>',
+    '<div class="pressure-high-container"><h4>🔴 EXTREME LONGS ({a:.1%})</h4><p>Potential for bearish squeeze if market breaks down</p></div>',
+)
+_PG_SHORT_PANELS = (
+    _PG_LONG_PANELS[0],
+    '<div class="pressure-low-container"><h4>🟡 HIGH SHORTS ({a:.1%})</h4><p>Caution - shorts may be crowded</p></div>',
+    '<div class="pressure-low-container"><h4>🟢 EXTREME SHORTS ({a:.1%})</h4><p>Potential for bullish squeeze if market breaks up</p></div>',
+)
 
 def calculate_pressure_gauge(long_oi, short_oi):
     """Calculate the Pressure Gauge: (Long OI - Short OI) / Total OI"""
     total_oi = long_oi + short_oi
-    if total_oi == 0:
-        return 0
-    return (long_oi - short_oi) / total_oi
+    return 0.0 if total_oi <= 0.0 else (long_oi - short_oi) / total_oi
+
+# Trend status results as (label, emoji); calculate_trend_status returns
+# these tuples themselves, so keep it uncached (st.cache_data hands out copies)
+_BULLISH = ("BULLISH (AETOS ACTIVE)", "🟢")
+_BEARISH = ("BEARISH (KHRUSOS ACTIVE)", "🔴")
 
 def calculate_trend_status(current_price, ma50):
     """Determine trend status based on MA50"""
-    if current_price > ma50:
-        return "BULLISH (AETOS ACTIVE)", "🟢"
-    else:
-        return "BEARISH (KHRUSOS ACTIVE)", "🔴"
+    return _BULLISH if current_price > ma50 else _BEARISH
+
+# Fibonacci retracement ratios and the level names they map to
+_FIB_RATIOS = np.array([0.236, 0.382, 0.500, 0.618, 0.786])
+_FIB_NAMES = ('23.6%', '38.2%', '50.0%', '61.8%', '78.6%', 'support', 'resistance')
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def calculate_fibonacci_array(high, low):
+    """Calculate Fibonacci levels as parallel (names, values) arrays"""
+    values = np.append(high - (high - low) * _FIB_RATIOS, (low, high))
+    return _FIB_NAMES, values
 
 def calculate_fibonacci_levels(high, low):
     """Calculate Fibonacci retracement levels"""
-    diff = high - low
-    levels = {
-        '23.6%': high - (diff * 0.236),
-        '38.2%': high - (diff * 0.382),
-        '50.0%': high - (diff * 0.500),
-        '61.8%': high - (diff * 0.618),
-        '78.6%': high - (diff * 0.786),
-        'support': low,
-        'resistance': high
-    }
-    return levels
+    names, values = calculate_fibonacci_array(high, low)
+    return dict(zip(names, values.tolist()))
+
+def _fib_table_rows(names, values, distances):
+    """Build (level, price, distance, marker) rows for the retracement levels"""
+    n = len(_FIB_RATIOS)
+    return tuple(
+        (name, f"${value:,.2f}", f"${distance:,.2f}", "🟢" if distance < 1000 else "⚪️")
+        for name, value, distance in zip(names[:n], values[:n].tolist(), distances[:n].tolist())
+    )
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _render_fib_table(rows):
+    """Render Fibonacci level rows as a single HTML table"""
+    body = "".join(
+        f"<tr><td>{marker} <strong>{name}</strong></td><td>{price}</td><td>{distance}</td></tr>"
+        for name, price, distance, marker in rows
+    )
+    return f'<table class="fib-table"><tr><th>Level</th><th>Price</th><th>Distance</th></tr>{body}</table>'
+
+# Minutes per candle for each supported timeframe
+_TF_MULTIPLIERS = {
+    '1m': 1,
+    '5m': 5,
+    '15m': 15,
+    '30m': 30,
+    '1h': 60,
+    '4h': 240,
+    '1d': 1440,
+    '1w': 10080
+}
 
 def calculate_timeframe_multiplier(timeframe):
     """Calculate multiplier for different timeframes"""
-    multipliers = {
-        '1m': 1,
-        '5m': 5,
-        '15m': 15,
-        '30m': 30,
-        '1h': 60,
-        '4h': 240,
-        '1d': 1440,
-        '1w': 10080
-    }
-    return multipliers.get(timeframe, 60)
+    return _TF_MULTIPLIERS.get(timeframe, 60)
 
 def calculate_rsi(prices, period=14):
     """Calculate RSI (Simplified version for demonstration)"""
@@ -173,232 +300,147 @@ def calculate_vwap(prices, volumes):
     
     return total_value / total_volume if total_volume > 0 else sum(prices) / len(prices)
 
+def _arb2(o1, o2, bankroll):
+    """Two-outcome arbitrage on scalars: (total_implied, implied_probs, stakes, profit)"""
+    p1 = 1.0 / o1
+    p2 = 1.0 / o2
+    total = p1 + p2
+    if total >= 1.0:
+        return total, (p1, p2), (), 0
+    s1 = bankroll * p1 / total
+    s2 = bankroll * p2 / total
+    return total, (p1, p2), (s1, s2), s1 * o1 - bankroll
+
+def _arb3(o1, o2, o3, bankroll):
+    """Three-outcome arbitrage on scalars: (total_implied, implied_probs, stakes, profit)"""
+    p1 = 1.0 / o1
+    p2 = 1.0 / o2
+    p3 = 1.0 / o3
+    total = math.fsum((p1, p2, p3))
+    if total >= 1.0:
+        return total, (p1, p2, p3), (), 0
+    s1 = bankroll * p1 / total
+    s2 = bankroll * p2 / total
+    s3 = bankroll * p3 / total
+    return total, (p1, p2, p3), (s1, s2, s3), s1 * o1 - bankroll
+
+def _arb_core(odds, bankroll):
+    """Pure arbitrage math: (total_implied, implied_probs, stakes, profit)"""
+    # The UI only offers 2 or 3 outcomes, so those get straight-line scalar paths
+    if len(odds) == 2:
+        return _arb2(odds[0], odds[1], bankroll)
+    return _arb3(odds[0], odds[1], odds[2], bankroll)
+
+# Shared fields of every result that carries no stakes (no arbitrage or error)
+_NO_ARB_TEMPLATE = MappingProxyType({
+    'is_arb_found': False,
+    'stakes': (),
+    'profit': 0,
+    'profit_pct': 0,
+    'total_implied': 0,
+    'market_efficiency': 0,
+    'implied_probs': (),
+    'error': None
+})
+
+@st.cache_data(ttl=3600, max_entries=128, show_spinner=False)
 def process_arbitrage_calculation(odds_list, bankroll):
     """Process the complete arbitrage calculation"""
-    try:
-        # Log calculation attempt
-        logger.info(f"Calculation attempt: odds={odds_list}, bankroll={bankroll}")
-        
-        # Calculate implied probabilities
-        implied_probs = [calculate_implied_probability(odd) for odd in odds_list]
-        
-        # Calculate total implied probability
-        total_implied = calculate_total_implied_probability(implied_probs)
-        
-        # Check for arbitrage
-        is_arb_found = total_implied < 1.0
-        
-        if is_arb_found:
-            # Calculate stakes
-            stakes = calculate_stakes(bankroll, implied_probs, total_implied)
-            
-            # Calculate profit (same for all outcomes in valid arb)
-            profit = (stakes[0] * odds_list[0]) - bankroll
-            
-            return {
-                'is_arb_found': True,
-                'stakes': stakes,
-                'profit': profit,
-                'total_implied': total_implied,
-                'implied_probs': implied_probs,
-                'error': None
-            }
-        else:
-            return {
-                'is_arb_found': False,
-                'stakes': [],
-                'profit': 0,
-                'total_implied': total_implied,
-                'implied_probs': implied_probs,
-                'error': None
-            }
-    except Exception as e:
-        logger.error(f"Calculation error: {str(e)}")
-        return {
-            'is_arb_found': False,
-            'stakes': [],
-            'profit': 0,
-            'total_implied': 0,
-            'implied_probs': [],
-            'error': str(e)
-        }
-
-def main():
-    # Configure Streamlit page
-    st.set_page_config(
-        page_title="Tri-Framework Oracle - Trading Mastery",
-        page_icon="🔮",
-        layout="wide",
-        initial_sidebar_state="expanded"
-    )
+    # Log calculation attempt
+    _logger().info("Calculation attempt: odds=%s, bankroll=%s", odds_list, bankroll)
     
-    # Custom CSS for dark mode and styling
-    st.markdown("""
-    <style>
-    .main {
-        background-color: #0e1117;
-        color: #ffffff;
-    }
-    .stApp {
-        background-color: #0e1117;
-        color: #ffffff;
-    }
-    .stTextInput > div > div > input {
-        background-color: #202938;
-        color: #ffffff;
-        border: 1px solid #374151;
-    }
-    .stNumberInput > div > div > input {
-        background-color: #202938;
-        color: #ffffff;
-        border: 1px solid #374151;
-    }
-    .stSelectbox > div > div {
-        background-color: #202938;
-        color: #ffffff;
-        border: 1px solid #374151;
-    }
-    .stButton > button {
-        background-color: #2563eb;
-        color: white;
-        border-radius: 8px;
-        padding: 10px 20px;
-        font-weight: bold;
-    }
-    .stButton > button:hover {
-        background-color: #1d4ed8;
-    }
-    .metric-container {
-        background-color: #1f2937;
-        padding: 15px;
-        border-radius: 10px;
-        margin: 10px 0;
-        border-left: 4px solid #2563eb;
-    }
-    .success-container {
-        background-color: #166534;
-        padding: 15px;
-        border-radius: 10px;
-        margin: 10px 0;
-        border-left: 4px solid #22c55e;
-    }
-    .error-container {
-        background-color: #991b1b;
-        padding: 15px;
-        border-radius: 10px;
-        margin: 10px 0;
-        border-left: 4px solid #ef4444;
-    }
-    .pressure-high-container {
-        background-color: #dc2626;
-        padding: 15px;
-        border-radius: 10px;
-        margin: 10px 0;
-        border-left: 4px solid #ef4444;
-    }
-    .pressure-low-container {
-        background-color: #16a34a;
-        padding: 15px;
-        border-radius: 10px;
-        margin: 10px 0;
-        border-left: 4px solid #22c55e;
-    }
-    .neutral-container {
-        background-color: #f59e0b;
-        padding: 15px;
-        border-radius: 10px;
-        margin: 10px 0;
-        border-left: 4px solid #fbbf24;
-    }
-    .fib-level {
-        background-color: #1f2937;
-        padding: 8px;
-        border-radius: 5px;
-        margin: 2px 0;
-        border-left: 2px solid #8b5cf6;
-    }
-    .indicator-bullish {
-        background-color: #16a34a;
-        padding: 8px;
-        border-radius: 5px;
-        margin: 2px 0;
-        border-left: 2px solid #22c55e;
-    }
-    .indicator-bearish {
-        background-color: #dc2626;
-        padding: 8px;
-        border-radius: 5px;
-        margin: 2px 0;
-        border-left: 2px solid #ef4444;
-    }
-    .indicator-neutral {
-        background-color: #f59e0b;
-        padding: 8px;
-        border-radius: 5px;
-        margin: 2px 0;
-        border-left: 2px solid #fbbf24;
-    }
-    .volume-high {
-        background-color: #16a34a;
-        padding: 8px;
-        border-radius: 5px;
-        margin: 2px 0;
-        border-left: 2px solid #22c55e;
-    }
-    .volume-low {
-        background-color: #dc2626;
-        padding: 8px;
-        border-radius: 5px;
-        margin: 2px 0;
-        border-left: 2px solid #ef4444;
-    }
-    .volume-neutral {
-        background-color: #f59e0b;
-        padding: 8px;
-        border-radius: 5px;
-        margin: 2px 0;
-        border-left: 2px solid #fbbf24;
-    }
-    h1, h2, h3, h4, h5, h6 {
-        color: #ffffff;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    # Validate inputs up front; finite positive odds and bankroll cannot raise
+    # in the math below
+    if len(odds_list) < 2:
+        error = "At least two outcomes are required"
+    elif len(odds_list) > 3:
+        error = "At most three outcomes are supported"
+    elif not all(validate_positive_number(odd) for odd in odds_list):
+        error = "All odds must be finite positive numbers"
+    elif not validate_positive_number(bankroll):
+        error = "Bankroll must be a finite positive number"
+    else:
+        error = None
+    if error:
+        _logger().error("Calculation error: %s", error)
+        return {**_NO_ARB_TEMPLATE, 'error': error}
     
-    # App title
-    st.title("🔮 Tri-Framework Oracle - Trading Mastery")
-    st.markdown("*Mathematical precision for BTC/USDT trading mastery*")
+    total_implied, implied_probs, stakes, profit = _arb_core(tuple(odds_list), bankroll)
     
-    # Navigation
-    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs(["Arbitrage Calculator", "Pressure Gauge", "Market Analysis", "Fibonacci Engine", "Technical Indicators", "Volume Analysis"])
+    # Check for arbitrage
+    is_arb_found = total_implied < 1.0
     
-    with tab1:
-        # Sidebar for configuration
-        with st.sidebar:
-            st.header("Configuration")
-            num_outcomes = st.radio(
-                "Number of Outcomes:",
-                options=[2, 3],
-                index=0,
-                horizontal=True
-            )
-            
-            st.markdown("---")
-            st.markdown("**Example Setup:**")
-            st.markdown("- Odds: 2.0, 3.0, 4.0")
-            st.markdown("- Bankroll: £100")
-            st.markdown("- Expected: Arbitrage found!")
-            
-            st.markdown("---")
-            st.markdown("*Personal Learning Tool*")
-            st.markdown("For educational purposes only")
+    if is_arb_found:
+        return {
+            'is_arb_found': True,
+            'stakes': stakes,
+            'profit': profit,
+            'profit_pct': profit / bankroll,
+            'total_implied': total_implied,
+            'market_efficiency': 1.0 - total_implied,
+            'implied_probs': implied_probs,
+            'error': None
+        }
+    else:
+        return {**_NO_ARB_TEMPLATE, 'total_implied': total_implied, 'implied_probs': implied_probs}
+
+@st.cache_resource(show_spinner=False)
+def _load_css():
+    """Read the page stylesheet once per server process"""
+    css = Path(__file__).with_name("style.css").read_text(encoding="utf-8")
+    return f"<style>\n{css}</style>"
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _now_str():
+    """Footer timestamp, refreshed at most once a minute"""
+    from datetime import datetime
+    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+def _arb_results_html(result, odds_inputs):
+    """Build the arbitrage-found results panel as one HTML block"""
+    prob_cells = "".join(
+        f'<div class="metric-container"><div>Outcome {letter}</div>'
+        f'<div class="metric-value">{prob:.2%}</div><div class="metric-delta">Odds: {odd}</div></div>'
+        for letter, odd, prob in zip(_OUTCOME_LETTERS, odds_inputs, result['implied_probs'])
+    )
+    stake_cells = "".join(
+        f'<div class="metric-container"><div>Stake on {letter}</div>'
+        f'<div class="metric-value">£{stake:.2f}</div><div class="metric-delta">Odds: {odd}</div></div>'
+        for letter, stake, odd in zip(_OUTCOME_LETTERS, result['stakes'], odds_inputs)
+    )
+    return (
+        f'{_ARB_FOUND_HTML}'
+        f'<h3>📊 Results:</h3>'
+        f'<h4>Implied Probabilities:</h4>'
+        f'<div class="metric-row">{prob_cells}</div>'
+        f'<p><strong>Total Implied Probability:</strong> {result["total_implied"]:.2%}</p>'
+        f'<p><strong>Market Efficiency:</strong> {result["market_efficiency"]:.2%} potential profit</p>'
+        f'<h4>Recommended Stakes:</h4>'
+        f'<div class="metric-row">{stake_cells}</div>'
+        f'<h3>💰 Guaranteed Profit: £{result["profit"]:.2f} ({result["profit_pct"]:.2%})</h3>'
+    )
+
+def _render_arbitrage_results(result, odds_inputs):
+    """Render the outcome of an arbitrage calculation"""
+    if result['error']:
+        st.html(_ARB_ERROR_TMPL.format(msg=html.escape(result['error'])))
+    elif result['is_arb_found']:
+        st.html(_arb_results_html(result, odds_inputs))
+    else:
+        st.html(_NO_ARB_TMPL.format(p=result['total_implied']))
         
+        # Show why no arb exists
+        if result['total_implied'] > 1.0:
+            inefficiency = (result['total_implied'] - 1.0) * 100
+            st.info(f"This market has {inefficiency:.2f}% overround - bookmaker's edge")
+
+@st.fragment
+def _render_arbitrage_tab(num_outcomes):
+    """Render the Arbitrage Calculator tab"""
+    with st.form("arb_form"):
         # Main input area
         col1, col2, col3 = st.columns([1, 1, 1])
         
-        # Get odds inputs based on selection
-        odds_inputs = []
-        
         with col1:
             odd1 = st.number_input(
                 "Outcome A Odds:",
@@ -409,7 +451,6 @@ def main():
                 format="%.2f",
                 key="odd1"
             )
-            odds_inputs.append(odd1)
         
         with col2:
             odd2 = st.number_input(
@@ -421,7 +462,6 @@ def main():
                 format="%.2f",
                 key="odd2"
             )
-            odds_inputs.append(odd2)
         
         if num_outcomes == 3:
             with col3:
@@ -434,13 +474,9 @@ def main():
                     format="%.2f",
                     key="odd3"
                 )
-                odds_inputs.append(odd3)
-        else:
-            odds_inputs.append(None)  # Placeholder for 2-outcome case
         
-        # Remove None values for 2-outcome case
-        if num_outcomes == 2:
-            odds_inputs = [odd for odd in odds_inputs if odd is not None]
+        # Collect odds inputs based on selection
+        odds_inputs = [odd1, odd2] + ([odd3] if num_outcomes == 3 else [])
         
         # Bankroll input
         bankroll = st.number_input(
@@ -452,71 +488,21 @@ def main():
             key="bankroll"
         )
         
-        # Calculate button
-        if st.button("🔮 Calculate Arbitrage", type="secondary"):
-            with st.spinner("Processing mathematical calculations..."):
-                result = process_arbitrage_calculation(odds_inputs, bankroll)
-                
-                if result['error']:
-                    st.markdown(
-                        f'<div class="error-container"><strong>Error:</strong> {result["error"]}</div>',
-                        unsafe_allow_html=True
-                    )
-                else:
-                    # Display results
-                    if result['is_arb_found']:
-                        st.markdown(
-                            '<div class="success-container"><h3>✅ ARBITRAGE OPPORTUNITY FOUND!</h3></div>',
-                            unsafe_allow_html=True
-                        )
-                        
-                        st.markdown("### 📊 Results:")
-                        
-                        # Display implied probabilities
-                        st.markdown("#### Implied Probabilities:")
-                        prob_cols = st.columns(len(odds_inputs))
-                        for i, (odd, prob) in enumerate(zip(odds_inputs, result['implied_probs'])):
-                            with prob_cols[i]:
-                                st.metric(
-                                    label=f"Outcome {chr(65+i)}",
-                                    value=f"{prob:.2%}",
-                                    delta=f"Odds: {odd}"
-                                )
-                        
-                        # Display total implied probability
-                        st.markdown(f"**Total Implied Probability:** {result['total_implied']:.2%}")
-                        st.markdown(f"**Market Efficiency:** {(1 - result['total_implied']):.2%} potential profit")
-                        
-                        # Display stakes and profit
-                        st.markdown("#### Recommended Stakes:")
-                        stake_cols = st.columns(len(odds_inputs))
-                        for i, (stake, odd) in enumerate(zip(result['stakes'], odds_inputs)):
-                            with stake_cols[i]:
-                                st.metric(
-                                    label=f"Stake on {chr(65+i)}",
-                                    value=f"£{stake:.2f}",
-                                    delta=f"Odds: {odd}"
-                                )
-                        
-                        st.markdown(
-                            f"### 💰 Guaranteed Profit: £{result['profit']:.2f} ({(result['profit']/bankroll)*100:.2f}%)"
-                        )
-                        
-                    else:
-                        st.markdown(
-                            f'<div class="error-container"><h3>❌ NO ARBITRAGE FOUND</h3><p>Total Implied Probability: {result["total_implied"]:.2%}</p></div>',
-                            unsafe_allow_html=True
-                        )
-                        
-                        # Show why no arb exists
-                        if result['total_implied'] > 1.0:
-                            inefficiency = (result['total_implied'] - 1.0) * 100
-                            st.info(f"This market has {inefficiency:.2f}% overround - bookmaker's edge")
+        submitted = st.form_submit_button("🔮 Calculate Arbitrage", type="secondary")
     
-    with tab2:
-        st.header("📊 Pressure Gauge Protocol")
-        st.markdown("*Positioning analysis: (Long OI - Short OI) / Total OI*")
+    if submitted:
+        with st.spinner("Processing mathematical calculations..."):
+            result = process_arbitrage_calculation(tuple(odds_inputs), bankroll)
         
+        _render_arbitrage_results(result, odds_inputs)
+
+@st.fragment
+def _render_pressure_tab():
+    """Render the Pressure Gauge tab"""
+    st.header("📊 Pressure Gauge Protocol")
+    st.markdown("*Positioning analysis: (Long OI - Short OI) / Total OI*")
+    
+    with st.form("pressure_form"):
         col1, col2 = st.columns(2)
         
         with col1:
@@ -539,60 +525,43 @@ def main():
                 key="short_oi"
             )
         
-        if st.button("📈 Calculate Pressure Gauge", type="secondary"):
-            with st.spinner("Analyzing positioning..."):
-                pressure_gauge = calculate_pressure_gauge(long_oi, short_oi)
-                
-                st.markdown("### 📊 Positioning Analysis:")
-                
-                # Display raw data
-                st.metric("Total Open Interest", f"{long_oi + short_oi:,.0f} BTC")
-                st.metric("Long OI", f"{long_oi:,.0f} BTC")
-                st.metric("Short OI", f"{short_oi:,.0f} BTC")
-                
-                # Display pressure gauge
-                st.markdown(f"### 🎯 Pressure Gauge: {pressure_gauge:.3f}")
-                
-                # Interpretation
-                if pressure_gauge > 0.5:
-                    st.markdown(
-                        f'<div class="pressure-high-container"><h4>🔴 EXTREME LONGS ({pressure_gauge:.1%})</h4><p>Potential for bearish squeeze if market breaks down</p></div>',
-                        unsafe_allow_html=True
-                    )
-                elif pressure_gauge < -0.5:
-                    st.markdown(
-                        f'<div class="pressure-low-container"><h4>🟢 EXTREME SHORTS ({abs(pressure_gauge):.1%})</h4><p>Potential for bullish squeeze if market breaks up</p></div>',
-                        unsafe_allow_html=True
-                    )
-                elif pressure_gauge > 0.2:
-                    st.markdown(
-                        f'<div class="pressure-high-container"><h4>🟡 HIGH LONGS ({pressure_gauge:.1%})</h4><p>Caution - longs may be crowded</p></div>',
-                        unsafe_allow_html=True
-                    )
-                elif pressure_gauge < -0.2:
-                    st.markdown(
-                        f'<div class="pressure-low-container"><h4>🟡 HIGH SHORTS ({abs(pressure_gauge):.1%})</h4><p>Caution - shorts may be crowded</p></div>',
-                        unsafe_allow_html=True
-                    )
-                else:
-                    st.markdown(
-                        f'<div class="neutral-container"><h4>⚪️ BALANCED ({pressure_gauge:.1%})</h4><p>Positioning appears neutral</p></div>',
-                        unsafe_allow_html=True
-                    )
-                
-                # Analysis interpretation
-                st.markdown("### 🔍 Analysis:")
-                if pressure_gauge > 0.7:
-                    st.warning("⚠️ EXTREME LONG CONGESTION - Potential for bearish break if support fails")
-                elif pressure_gauge < -0.7:
-                    st.success("✅ EXTREME SHORT CONGESTION - Potential for bullish break if resistance breaks")
-                elif abs(pressure_gauge) > 0.3:
-                    st.info(f"ℹ️ POSITIONING ASYMMETRY DETECTED - Current bias: {'LONG' if pressure_gauge > 0 else 'SHORT'}")
+        submitted = st.form_submit_button("📈 Calculate Pressure Gauge", type="secondary")
     
-    with tab3:
-        st.header("📈 Market Analysis Dashboard")
-        st.markdown("*Tri-Framework integration with Fibonacci alignment*")
-        
+    if submitted:
+        with st.spinner("Analyzing positioning..."):
+            pressure_gauge = calculate_pressure_gauge(long_oi, short_oi)
+            
+            st.markdown("### 📊 Positioning Analysis:")
+            
+            # Display raw data
+            st.metric("Total Open Interest", f"{long_oi + short_oi:,.0f} BTC")
+            st.metric("Long OI", f"{long_oi:,.0f} BTC")
+            st.metric("Short OI", f"{short_oi:,.0f} BTC")
+            
+            # Display pressure gauge
+            st.markdown(f"### 🎯 Pressure Gauge: {pressure_gauge:.3f}")
+            
+            # Interpretation
+            panels = _PG_LONG_PANELS if pressure_gauge > 0 else _PG_SHORT_PANELS
+            panel = panels[bisect.bisect_left(_PG_LEVELS, abs(pressure_gauge))]
+            st.html(panel.format(p=pressure_gauge, a=abs(pressure_gauge)))
+            
+            # Analysis interpretation
+            st.markdown("### 🔍 Analysis:")
+            if pressure_gauge > 0.7:
+                st.warning("⚠️ EXTREME LONG CONGESTION - Potential for bearish break if support fails")
+            elif pressure_gauge < -0.7:
+                st.success("✅ EXTREME SHORT CONGESTION - Potential for bullish break if resistance breaks")
+            elif abs(pressure_gauge) > 0.3:
+                st.info(f"ℹ️ POSITIONING ASYMMETRY DETECTED - Current bias: {'LONG' if pressure_gauge > 0 else 'SHORT'}")
+
+@st.fragment
+def _render_market_tab():
+    """Render the Market Analysis tab"""
+    st.header("📈 Market Analysis Dashboard")
+    st.markdown("*Tri-Framework integration with Fibonacci alignment*")
+    
+    with st.form("market_form"):
         col1, col2 = st.columns(2)
         
         with col1:
@@ -633,59 +602,67 @@ def main():
                 key="recent_low"
             )
         
-        if st.button("🎯 Analyze Market Structure", type="secondary"):
-            with st.spinner("Analyzing market structure..."):
-                # Calculate Fibonacci levels
-                fib_levels = calculate_fibonacci_levels(recent_high, recent_low)
-                
-                # Trend analysis
-                trend_status, trend_emoji = calculate_trend_status(current_price, ma50)
-                
-                st.markdown("### 📊 Market Structure Analysis:")
-                
-                # Display current market status
-                st.metric("Current Price", f"${current_price:,.2f}")
-                st.metric("MA50", f"${ma50:,.2f}")
-                st.metric("Swing High", f"${recent_high:,.2f}")
-                st.metric("Swing Low", f"${recent_low:,.2f}")
-                
-                # Trend analysis
-                st.markdown(f"### 🎯 Trend Status: {trend_emoji} {trend_status}")
-                
-                # Fibonacci levels
-                st.markdown("### 📐 Fibonacci Levels:")
-                for level_name, level_value in fib_levels.items():
-                    if level_name not in ['support', 'resistance']:
-                        color = "🟢" if abs(current_price - level_value) < 1000 else "⚪️"
-                        st.markdown(f"<div class='fib-level'>{color} **{level_name}: ${level_value:,.2f}**</div>", unsafe_allow_html=True)
-                
-                # Price position relative to Fibonacci levels
-                st.markdown("### 📍 Price Positioning:")
-                closest_fib = min(fib_levels.values(), key=lambda x: abs(x - current_price))
-                fib_distance = abs(current_price - closest_fib)
-                st.info(f"Closest Fibonacci level: ${closest_fib:,.2f} (Distance: ${fib_distance:,.2f})")
-                
-                # Framework integration
-                st.markdown("### 🔮 Tri-Framework Status:")
-                if current_price > ma50:
-                    st.success("✅ AETOS PROTOCOL ACTIVE - Trading with primary trend")
-                    st.info("🎯 Strategy: Look for entries above key Fibonacci levels")
-                else:
-                    st.warning("⚠️ KHRUSOS PROTOCOL ACTIVE - Capital preservation mode")
-                    st.info("🎯 Strategy: Look for entries below key Fibonacci levels")
-                
-                # Compression analysis
-                compression_distance = recent_high - recent_low
-                if compression_distance < 1000:  # Less than $1000 range
-                    st.warning(f"⚠️ COMPRESSION DETECTED: Only {compression_distance:.2f} points between swing high and low")
-                    st.info("🎯 ALPHA COMPRESSION SPRING - High probability setup when compression breaks")
-                else:
-                    st.info(f"📊 Current Range: {compression_distance:.2f} points")
+        submitted = st.form_submit_button("🎯 Analyze Market Structure", type="secondary")
     
-    with tab4:
-        st.header("🧮 Fibonacci Engine - Multi-Timeframe Analysis")
-        st.markdown("*Magnifying glass for small timeframes, binoculars for long-term trends*")
-        
+    if submitted:
+        with st.spinner("Analyzing market structure..."):
+            # Calculate Fibonacci levels
+            fib_names, fib_values = calculate_fibonacci_array(recent_high, recent_low)
+            
+            # Trend analysis
+            trend_status, trend_emoji = calculate_trend_status(current_price, ma50)
+            
+            st.markdown("### 📊 Market Structure Analysis:")
+            
+            # Display current market status
+            st.dataframe(
+                {
+                    "Metric": ["Current Price", "MA50", "Swing High", "Swing Low"],
+                    "Value": [f"${v:,.2f}" for v in (current_price, ma50, recent_high, recent_low)]
+                },
+                hide_index=True,
+                use_container_width=True
+            )
+            
+            # Trend analysis
+            st.markdown(f"### 🎯 Trend Status: {trend_emoji} {trend_status}")
+            
+            # Fibonacci levels
+            st.markdown("### 📐 Fibonacci Levels:")
+            fib_distances = np.abs(fib_values - current_price)
+            st.html(_render_fib_table(_fib_table_rows(fib_names, fib_values, fib_distances)))
+            
+            # Price position relative to Fibonacci levels
+            st.markdown("### 📍 Price Positioning:")
+            closest_idx = int(np.argmin(fib_distances))
+            closest_fib = float(fib_values[closest_idx])
+            fib_distance = float(fib_distances[closest_idx])
+            st.info(f"Closest Fibonacci level: ${closest_fib:,.2f} (Distance: ${fib_distance:,.2f})")
+            
+            # Framework integration
+            st.markdown("### 🔮 Tri-Framework Status:")
+            if current_price > ma50:
+                st.success("✅ AETOS PROTOCOL ACTIVE - Trading with primary trend")
+                st.info("🎯 Strategy: Look for entries above key Fibonacci levels")
+            else:
+                st.warning("⚠️ KHRUSOS PROTOCOL ACTIVE - Capital preservation mode")
+                st.info("🎯 Strategy: Look for entries below key Fibonacci levels")
+            
+            # Compression analysis
+            compression_distance = recent_high - recent_low
+            if compression_distance < 1000:  # Less than $1000 range
+                st.warning(f"⚠️ COMPRESSION DETECTED: Only {compression_distance:.2f} points between swing high and low")
+                st.info("🎯 ALPHA COMPRESSION SPRING - High probability setup when compression breaks")
+            else:
+                st.info(f"📊 Current Range: {compression_distance:.2f} points")
+
+@st.fragment
+def _render_fibonacci_tab():
+    """Render the Fibonacci Engine tab"""
+    st.header("🧮 Fibonacci Engine - Multi-Timeframe Analysis")
+    st.markdown("*Magnifying glass for small timeframes, binoculars for long-term trends*")
+    
+    with st.form("fib_form"):
         col1, col2 = st.columns(2)
         
         with col1:
@@ -724,375 +701,349 @@ def main():
                 key="timeframe"
             )
         
-        if st.button("🧮 Calculate Fibonacci Analysis", type="secondary"):
-            with st.spinner("Calculating Fibonacci levels..."):
-                # Calculate Fibonacci levels
-                fib_levels = calculate_fibonacci_levels(high_price, low_price)
-                
-                st.markdown("### 📐 Fibonacci Retracement Levels:")
-                
-                # Create columns for Fibonacci levels
-                cols = st.columns(5)
-                fib_items = list(fib_levels.items())
-                
-                for i, (level_name, level_value) in enumerate(fib_levels.items()):
-                    if level_name not in ['support', 'resistance']:
-                        with cols[i % 5]:
-                            st.metric(label=level_name, value=f"${level_value:,.2f}")
-                
-                st.markdown("### 📍 Current Price Analysis:")
-                
-                # Determine which Fibonacci level current price is closest to
-                distances = {name: abs(current_price_fib - value) for name, value in fib_levels.items()}
-                closest_level = min(distances, key=distances.get)
-                closest_distance = distances[closest_level]
-                
-                st.metric(
-                    label=f"Closest Level: {closest_level}",
-                    value=f"${fib_levels[closest_level]:,.2f}",
-                    delta=f"${closest_distance:.2f} away"
-                )
-                
-                # Fibonacci level interpretation
-                st.markdown("### 🎯 Fibonacci Interpretation:")
-                
-                # Check if price is near specific levels
-                for level_name, level_value in fib_levels.items():
-                    if level_name not in ['support', 'resistance']:
-                        distance = abs(current_price_fib - level_value)
-                        if distance < 500:  # If within $500 of level
-                            st.success(f"🎯 PRICE NEAR {level_name} LEVEL (${level_value:,.2f}) - Potential Support/Resistance")
-                        elif distance < 1000:  # If within $1000 of level
-                            st.info(f"ℹ️ PRICE APPROACHING {level_name} LEVEL (${level_value:,.2f})")
-                
-                # Timeframe analysis
-                st.markdown(f"### 🕐 Timeframe Analysis: {timeframe}")
-                multiplier = calculate_timeframe_multiplier(timeframe)
-                st.info(f"Timeframe multiplier: {multiplier} minutes")
-                
-                if multiplier <= 60:  # Short timeframes (1m-1h)
-                    st.warning("🔍 MAGNIFYING GLASS MODE: Short-term analysis, higher volatility expected")
-                elif multiplier <= 1440:  # Medium timeframes (4h-1d)
-                    st.info("⚖️ BALANCED VIEW: Medium-term analysis, balanced risk/reward")
-                else:  # Long timeframes (1d-1w)
-                    st.success(" binoculars MODE: Long-term analysis, lower volatility expected")
-                
-                # Multi-timeframe alignment
-                st.markdown("### 🎯 Multi-Timeframe Alignment:")
-                if current_price_fib > fib_levels['50.0%']:
-                    st.success("📈 PRICE ABOVE 50% LEVEL - Bullish bias on multiple timeframes")
+        submitted = st.form_submit_button("🧮 Calculate Fibonacci Analysis", type="secondary")
+    
+    if submitted:
+        with st.spinner("Calculating Fibonacci levels..."):
+            # Calculate Fibonacci levels
+            fib_names, fib_values = calculate_fibonacci_array(high_price, low_price)
+            
+            st.markdown("### 📐 Fibonacci Retracement Levels:")
+            fib_distances = np.abs(fib_values - current_price_fib)
+            st.html(_render_fib_table(_fib_table_rows(fib_names, fib_values, fib_distances)))
+            
+            st.markdown("### 📍 Current Price Analysis:")
+            
+            # Determine which Fibonacci level current price is closest to
+            closest_idx = int(np.argmin(fib_distances))
+            closest_level = fib_names[closest_idx]
+            closest_distance = float(fib_distances[closest_idx])
+            
+            st.metric(
+                label=f"Closest Level: {closest_level}",
+                value=f"${fib_values[closest_idx]:,.2f}",
+                delta=f"${closest_distance:.2f} away"
+            )
+            
+            # Fibonacci level interpretation
+            st.markdown("### 🎯 Fibonacci Interpretation:")
+            
+            # Check if price is near specific levels (within $500) or approaching them (within $1000)
+            retracement_distances = fib_distances[:len(_FIB_RATIOS)]
+            for i in np.flatnonzero(retracement_distances < 1000).tolist():
+                level_name, level_value = fib_names[i], fib_values[i]
+                if retracement_distances[i] < 500:
+                    st.success(f"🎯 PRICE NEAR {level_name} LEVEL (${level_value:,.2f}) - Potential Support/Resistance")
                 else:
-                    st.error("📉 PRICE BELOW 50% LEVEL - Bearish bias on multiple timeframes")
-                
-                if abs(current_price_fib - fib_levels['38.2%']) < 500 or abs(current_price_fib - fib_levels['61.8%']) < 500:
-                    st.warning("⚠️ PRICE NEAR KEY FIBONACCI LEVEL - High probability reversal zone")
+                    st.info(f"ℹ️ PRICE APPROACHING {level_name} LEVEL (${level_value:,.2f})")
+            
+            # Timeframe analysis
+            st.markdown(f"### 🕐 Timeframe Analysis: {timeframe}")
+            multiplier = calculate_timeframe_multiplier(timeframe)
+            st.info(f"Timeframe multiplier: {multiplier} minutes")
+            
+            if multiplier <= 60:  # Short timeframes (1m-1h)
+                st.warning("🔍 MAGNIFYING GLASS MODE: Short-term analysis, higher volatility expected")
+            elif multiplier <= 1440:  # Medium timeframes (4h-1d)
+                st.info("⚖️ BALANCED VIEW: Medium-term analysis, balanced risk/reward")
+            else:  # Long timeframes (1d-1w)
+                st.success(" binoculars MODE: Long-term analysis, lower volatility expected")
+            
+            # Multi-timeframe alignment
+            st.markdown("### 🎯 Multi-Timeframe Alignment:")
+            if current_price_fib > fib_values[fib_names.index('50.0%')]:
+                st.success("📈 PRICE ABOVE 50% LEVEL - Bullish bias on multiple timeframes")
+            else:
+                st.error("📉 PRICE BELOW 50% LEVEL - Bearish bias on multiple timeframes")
+            
+            if fib_distances[fib_names.index('38.2%')] < 500 or fib_distances[fib_names.index('61.8%')] < 500:
+                st.warning("⚠️ PRICE NEAR KEY FIBONACCI LEVEL - High probability reversal zone")
+
+@st.fragment
+def _render_indicators_tab():
+    """Render the Technical Indicators tab"""
+    st.header("📊 Technical Indicators - DMI & RSI Integration")
+    st.markdown("*Trend strength and momentum analysis for 99.99% certainty*")
     
-    with tab5:
-        st.header("📊 Technical Indicators - DMI & RSI Integration")
-        st.markdown("*Trend strength and momentum analysis for 99.99% certainty*")
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("DMI (Directional Movement Index)")
+        st.markdown("*Trend strength validation*")
         
-        col1, col2 = st.columns(2)
+        # Timeframe selector for DMI
+        dmi_timeframe = st.selectbox(
+            "DMI Timeframe:",
+            options=['1m', '5m', '15m', '30m', '1h', '4h', '1d', '1w'],
+            index=4,  # Default to 1h
+            key="dmi_timeframe"
+        )
         
-        with col1:
-            st.subheader("DMI (Directional Movement Index)")
-            st.markdown("*Trend strength validation*")
+        # Simulated price data for DMI calculation (will be replaced by API data)
+        high_prices = st.text_input("High Prices (comma separated, last 15 values):", 
+                                   "110000,110100,110200,110150,110250,110300,110200,110100,110150,110200,110100,110050,110000,109950,109900")
+        low_prices = st.text_input("Low Prices (comma separated, last 15 values):", 
+                                  "109500,109600,109700,109650,109750,109800,109700,109600,109650,109700,109600,109550,109500,109450,109400")
+        close_prices = st.text_input("Close Prices (comma separated, last 15 values):", 
+                                    "109800,109900,110000,109950,110050,110100,110000,109900,109950,110000,109900,109850,109800,109750,109700")
+    
+    with col2:
+        st.subheader("RSI (Relative Strength Index)")
+        st.markdown("*Momentum analysis*")
+        
+        # Timeframe selector for RSI
+        rsi_timeframe = st.selectbox(
+            "RSI Timeframe:",
+            options=['1m', '5m', '15m', '30m', '1h', '4h', '1d', '1w'],
+            index=4,  # Default to 1h
+            key="rsi_timeframe"
+        )
+        
+        # Simulated price data for RSI calculation (will be replaced by API data)
+        prices = st.text_input("Price Data (comma separated, last 15 values):", 
+                              "109550,109600,109650,109700,109750,109800,109850,109900,109950,110000,110050,110100,110150,110200,110250")
+    
+    if st.button("📊 Calculate Technical Indicators", type="secondary"):
+        with st.spinner("Calculating DMI and RSI..."):
+            # Parse the input data
+            try:
+                high_list = [float(x.strip()) for x in high_prices.split(',')]
+                low_list = [float(x.strip()) for x in low_prices.split(',')]
+                close_list = [float(x.strip()) for x in close_prices.split(',')]
+                price_list = [float(x.strip()) for x in prices.split(',')]
+            except:
+                st.error("Please enter valid comma-separated numbers")
+                return
             
-            # Timeframe selector for DMI
-            dmi_timeframe = st.selectbox(
-                "DMI Timeframe:",
-                options=['1m', '5m', '15m', '30m', '1h', '4h', '1d', '1w'],
-                index=4,  # Default to 1h
-                key="dmi_timeframe"
-            )
+            # Calculate DMI
+            pdi, mdi = calculate_dmi(high_list, low_list, close_list)
             
-            # Simulated price data for DMI calculation (will be replaced by API data)
-            high_prices = st.text_input("High Prices (comma separated, last 15 values):", 
-                                       "110000,110100,110200,110150,110250,110300,110200,110100,110150,110200,110100,110050,110000,109950,109900")
-            low_prices = st.text_input("Low Prices (comma separated, last 15 values):", 
-                                      "109500,109600,109700,109650,109750,109800,109700,109600,109650,109700,109600,109550,109500,109450,109400")
-            close_prices = st.text_input("Close Prices (comma separated, last 15 values):", 
-                                        "109800,109900,110000,109950,110050,110100,110000,109900,109950,110000,109900,109850,109800,109750,109700")
-        
-        with col2:
-            st.subheader("RSI (Relative Strength Index)")
-            st.markdown("*Momentum analysis*")
+            # Calculate RSI
+            rsi = calculate_rsi(price_list)
             
-            # Timeframe selector for RSI
-            rsi_timeframe = st.selectbox(
-                "RSI Timeframe:",
-                options=['1m', '5m', '15m', '30m', '1h', '4h', '1d', '1w'],
-                index=4,  # Default to 1h
-                key="rsi_timeframe"
-            )
+            st.markdown("### 📊 Technical Analysis Results:")
             
-            # Simulated price data for RSI calculation (will be replaced by API data)
-            prices = st.text_input("Price Data (comma separated, last 15 values):", 
-                                  "109550,109600,109650,109700,109750,109800,109850,109900,109950,110000,110050,110100,110150,110200,110250")
+            # Display selected timeframes
+            st.info(f"DMI Timeframe: {dmi_timeframe} | RSI Timeframe: {rsi_timeframe}")
+            
+            # DMI Analysis
+            st.markdown("#### 📈 DMI Analysis:")
+            col_dmi1, col_dmi2 = st.columns(2)
+            
+            with col_dmi1:
+                st.metric("PDI (Positive Directional Indicator)", f"{pdi:.2f}")
+            
+            with col_dmi2:
+                st.metric("MDI (Negative Directional Indicator)", f"{mdi:.2f}")
+            
+            # DMI Interpretation
+            if pdi > mdi + 10:
+                dmi_panel = _DMI_BULLISH_TMPL
+            elif mdi > pdi + 10:
+                dmi_panel = _DMI_BEARISH_TMPL
+            else:
+                dmi_panel = _DMI_NEUTRAL_TMPL
+            st.html(dmi_panel.format(pdi=pdi, mdi=mdi))
+            
+            # RSI Analysis
+            st.markdown("#### 📊 RSI Analysis:")
+            st.metric("RSI (14-period)", f"{rsi:.2f}")
+            
+            # RSI Interpretation
+            if rsi > 70:
+                rsi_panel = _RSI_OVERBOUGHT_TMPL
+            elif rsi < 30:
+                rsi_panel = _RSI_OVERSOLD_TMPL
+            else:
+                rsi_panel = _RSI_NEUTRAL_TMPL
+            st.html(rsi_panel.format(rsi=rsi))
+            
+            # Combined Analysis
+            st.markdown("### 🔮 Combined Technical Analysis:")
+            
+            if pdi > mdi + 10 and rsi < 70 and rsi > 30:
+                st.success("✅ BULLISH CONFLUENCE: Strong trend + Neutral momentum = AETOS PROTOCOL OPTIMAL")
+            elif mdi > pdi + 10 and rsi < 70 and rsi > 30:
+                st.warning("⚠️ BEARISH CONFLUENCE: Strong trend + Neutral momentum = KHRUSOS PROTOCOL OPTIMAL")
+            elif pdi > mdi + 10 and rsi < 30:
+                st.info("ℹ️ BULLISH DIVERGENCE: Strong trend + Oversold = Potential reversal")
+            elif mdi > pdi + 10 and rsi > 70:
+                st.info("ℹ️ BEARISH DIVERGENCE: Strong trend + Overbought = Potential reversal")
+            else:
+                st.info("📊 Mixed signals - Wait for clearer confluence")
+            
+            # Framework Integration
+            st.markdown("### 🎯 Framework Integration:")
+            st.info("DMI + RSI analysis now feeds into your 99.99% certainty stack")
+            st.info("Perfect foundation for AI agent data quantification")
+
+@st.fragment
+def _render_volume_tab():
+    """Render the Volume Analysis tab"""
+    st.header("📊 Volume Analysis - MA50 Aligned")
+    st.markdown("*Volume vs MA50, Delta Analysis, and VWAP for Institutional Levels*")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("Volume Analysis")
+        st.markdown("*Current vs Average Volume, Buy/Sell Pressure*")
         
-        if st.button("📊 Calculate Technical Indicators", type="secondary"):
-            with st.spinner("Calculating DMI and RSI..."):
-                # Parse the input data
-                try:
-                    high_list = [float(x.strip()) for x in high_prices.split(',')]
-                    low_list = [float(x.strip()) for x in low_prices.split(',')]
-                    close_list = [float(x.strip()) for x in close_prices.split(',')]
-                    price_list = [float(x.strip()) for x in prices.split(',')]
-                except:
-                    st.error("Please enter valid comma-separated numbers")
-                    return
-                
-                # Calculate DMI
-                pdi, mdi = calculate_dmi(high_list, low_list, close_list)
-                
-                # Calculate RSI
-                rsi = calculate_rsi(price_list)
-                
-                st.markdown("### 📊 Technical Analysis Results:")
-                
-                # Display selected timeframes
-                st.info(f"DMI Timeframe: {dmi_timeframe} | RSI Timeframe: {rsi_timeframe}")
-                
-                # DMI Analysis
-                st.markdown("#### 📈 DMI Analysis:")
-                col_dmi1, col_dmi2 = st.columns(2)
-                
-                with col_dmi1:
-                    st.metric("PDI (Positive Directional Indicator)", f"{pdi:.2f}")
-                
-                with col_dmi2:
-                    st.metric("MDI (Negative Directional Indicator)", f"{mdi:.2f}")
-                
-                # DMI Interpretation
-                if pdi > mdi + 10:
-                    st.markdown(
-                        f'<div class="indicator-bullish"><h4>🟢 BULLISH TREND STRENGTH</h4><p>PDI ({pdi:.2f}) significantly stronger than MDI ({mdi:.2f})</p></div>',
-                        unsafe_allow_html=True
-                    )
-                elif mdi > pdi + 10:
-                    st.markdown(
-                        f'<div class="indicator-bearish"><h4>🔴 BEARISH TREND STRENGTH</h4><p>MDI ({mdi:.2f}) significantly stronger than PDI ({pdi:.2f})</p></div>',
-                        unsafe_allow_html=True
-                    )
-                else:
-                    st.markdown(
-                        f'<div class="indicator-neutral"><h4>🟡 NEUTRAL TREND STRENGTH</h4><p>PDI ({pdi:.2f}) and MDI ({mdi:.2f}) are balanced</p></div>',
-                        unsafe_allow_html=True
-                    )
-                
-                # RSI Analysis
-                st.markdown("#### 📊 RSI Analysis:")
-                st.metric("RSI (14-period)", f"{rsi:.2f}")
-                
-                # RSI Interpretation
-                if rsi > 70:
-                    st.markdown(
-                        f'<div class="indicator-bearish"><h4>🔴 OVERBOUGHT ({rsi:.2f})</h4><p>Potential for reversal down</p></div>',
-                        unsafe_allow_html=True
-                    )
-                elif rsi < 30:
-                    st.markdown(
-                        f'<div class="indicator-bullish"><h4>🟢 OVERSOLD ({rsi:.2f})</h4><p>Potential for reversal up</p></div>',
-                        unsafe_allow_html=True
-                    )
-                else:
-                    st.markdown(
-                        f'<div class="indicator-neutral"><h4>🟡 NEUTRAL ({rsi:.2f})</h4><p>Market in balanced state</p></div>',
-                        unsafe_allow_html=True
-                    )
-                
-                # Combined Analysis
-                st.markdown("### 🔮 Combined Technical Analysis:")
-                
-                if pdi > mdi + 10 and rsi < 70 and rsi > 30:
-                    st.success("✅ BULLISH CONFLUENCE: Strong trend + Neutral momentum = AETOS PROTOCOL OPTIMAL")
-                elif mdi > pdi + 10 and rsi < 70 and rsi > 30:
-                    st.warning("⚠️ BEARISH CONFLUENCE: Strong trend + Neutral momentum = KHRUSOS PROTOCOL OPTIMAL")
-                elif pdi > mdi + 10 and rsi < 30:
-                    st.info("ℹ️ BULLISH DIVERGENCE: Strong trend + Oversold = Potential reversal")
-                elif mdi > pdi + 10 and rsi > 70:
-                    st.info("ℹ️ BEARISH DIVERGENCE: Strong trend + Overbought = Potential reversal")
-                else:
-                    st.info("📊 Mixed signals - Wait for clearer confluence")
-                
-                # Framework Integration
-                st.markdown("### 🎯 Framework Integration:")
-                st.info("DMI + RSI analysis now feeds into your 99.99% certainty stack")
-                st.info("Perfect foundation for AI agent data quantification")
+        # Volume data input
+        current_volume = st.number_input(
+            "Current Candle Volume:",
+            min_value=0.0,
+            value=1500.0,
+            step=100.0,
+            format="%.2f",
+            key="current_volume"
+        )
+        
+        volume_history = st.text_input(
+            "Volume History (comma separated, last 20 values):",
+            "1200,1300,1400,1250,1350,1450,1300,1200,1300,1400,1250,1350,1450,1300,1200,1300,1400,1250,1350,1450"
+        )
     
-    with tab6:
-        st.header("📊 Volume Analysis - MA50 Aligned")
-        st.markdown("*Volume vs MA50, Delta Analysis, and VWAP for Institutional Levels*")
+    with col2:
+        st.subheader("VWAP Calculation")
+        st.markdown("*Institutional level identification*")
         
-        col1, col2 = st.columns(2)
+        # Price and volume data for VWAP
+        prices = st.text_input(
+            "Price Data (comma separated, last 20 values):",
+            "109550,109600,109650,109700,109750,109800,109850,109900,109950,110000,110050,110100,110150,110200,110250,110300,110350,110400,110450,110500"
+        )
         
-        with col1:
-            st.subheader("Volume Analysis")
-            st.markdown("*Current vs Average Volume, Buy/Sell Pressure*")
+        vwap_volumes = st.text_input(
+            "Volume Data for VWAP (comma separated, last 20 values):",
+            "1200,1300,1400,1250,1350,1450,1300,1200,1300,1400,1250,1350,1450,1300,1200,1300,1400,1250,1350,1450"
+        )
+    
+    if st.button("📊 Calculate Volume Analysis", type="secondary"):
+        with st.spinner("Analyzing volume data..."):
+            # Parse volume history
+            try:
+                vol_history = [float(x.strip()) for x in volume_history.split(',')]
+            except:
+                st.error("Please enter valid comma-separated volume numbers")
+                return
             
-            # Volume data input
-            current_volume = st.number_input(
-                "Current Candle Volume:",
-                min_value=0.0,
-                value=1500.0,
-                step=100.0,
-                format="%.2f",
-                key="current_volume"
-            )
+            # Parse price and volume data for VWAP
+            try:
+                price_list = [float(x.strip()) for x in prices.split(',')]
+                vol_list = [float(x.strip()) for x in vwap_volumes.split(',')]
+            except:
+                st.error("Please enter valid comma-separated price and volume numbers")
+                return
             
-            volume_history = st.text_input(
-                "Volume History (comma separated, last 20 values):",
-                "1200,1300,1400,1250,1350,1450,1300,1200,1300,1400,1250,1350,1450,1300,1200,1300,1400,1250,1350,1450"
-            )
-        
-        with col2:
-            st.subheader("VWAP Calculation")
-            st.markdown("*Institutional level identification*")
+            # Calculate volume analysis
+            volume_ratio, volume_status, delta_status = calculate_volume_analysis(current_volume, vol_history)
+            
+            # Calculate VWAP
+            vwap = calculate_vwap(price_list, vol_list)
             
-            # Price and volume data for VWAP
-            prices = st.text_input(
-                "Price Data (comma separated, last 20 values):",
-                "109550,109600,109650,109700,109750,109800,109850,109900,109950,110000,110050,110100,110150,110200,110250,110300,110350,110400,110450,110500"
+            st.markdown("### 📊 Volume Analysis Results:")
+            
+            # Current volume vs average
+            st.metric(
+                "Volume Ratio (Current/Average)",
+                f"{volume_ratio:.2f}x",
+                delta=f"{volume_status} volume"
             )
             
-            vwap_volumes = st.text_input(
-                "Volume Data for VWAP (comma separated, last 20 values):",
-                "1200,1300,1400,1250,1350,1450,1300,1200,1300,1400,1250,1350,1450,1300,1200,1300,1400,1250,1350,1450"
+            # Volume status
+            st.html(_VOLUME_PANELS.get(volume_status, _VOLUME_AVERAGE_TMPL).format(status=volume_status))
+            
+            # Volume delta (trend)
+            st.markdown(f"### 📈 Volume Delta: {delta_status}")
+            if delta_status == "INCREASING":
+                st.success("📈 Volume is increasing - potential for trend acceleration")
+            elif delta_status == "DECREASING":
+                st.warning("📉 Volume is decreasing - potential for trend exhaustion")
+            else:
+                st.info("⚖️ Volume is stable - maintaining current trend strength")
+            
+            # VWAP Analysis
+            st.markdown("### 🎯 VWAP Analysis:")
+            st.metric("VWAP (Institutional Level)", f"${vwap:,.2f}")
+            
+            # VWAP vs Current Price (assuming current price is from Market Analysis)
+            current_price = st.session_state.get('current_price', 109550.0)
+            price_vwap_diff = current_price - vwap
+            price_vwap_ratio = (current_price / vwap - 1) * 100
+            
+            st.metric(
+                "Price vs VWAP",
+                f"${price_vwap_diff:,.2f}",
+                delta=f"{price_vwap_ratio:.2f}%"
             )
+            
+            if current_price > vwap:
+                st.success(f"✅ PRICE ABOVE VWAP: {price_vwap_ratio:.2f}% - Bullish bias, institutional support below")
+            else:
+                st.error(f"❌ PRICE BELOW VWAP: {price_vwap_ratio:.2f}% - Bearish bias, institutional resistance above")
+            
+            # Volume Framework Integration
+            st.markdown("### 🎯 Framework Integration:")
+            if volume_status == "HIGH" and delta_status == "INCREASING":
+                st.info("🚀 HIGH INCREASING VOLUME - Potential for 'Mountain Climb/Drop' - Monitor for breakouts")
+            elif volume_status == "LOW" and delta_status == "DECREASING":
+                st.warning("⏸️ LOW DECREASING VOLUME - Potential for consolidation - Wait for volume confirmation")
+            
+            st.info("Volume analysis now feeds into your positioning and entry timing decisions")
+
+def main():
+    # Configure Streamlit page
+    st.set_page_config(**_PAGE_CONFIG)
+    
+    # Custom CSS for dark mode and styling
+    st.markdown(_load_css(), unsafe_allow_html=True)
+    
+    # App title
+    st.title("🔮 Tri-Framework Oracle - Trading Mastery")
+    st.markdown("*Mathematical precision for BTC/USDT trading mastery*")
+    
+    # Sidebar for configuration
+    with st.sidebar:
+        st.header("Configuration")
+        num_outcomes = st.radio(
+            "Number of Outcomes:",
+            options=[2, 3],
+            index=0,
+            horizontal=True
+        )
         
-        if st.button("📊 Calculate Volume Analysis", type="secondary"):
-            with st.spinner("Analyzing volume data..."):
-                # Parse volume history
-                try:
-                    vol_history = [float(x.strip()) for x in volume_history.split(',')]
-                except:
-                    st.error("Please enter valid comma-separated volume numbers")
-                    return
-                
-                # Parse price and volume data for VWAP
-                try:
-                    price_list = [float(x.strip()) for x in prices.split(',')]
-                    vol_list = [float(x.strip()) for x in vwap_volumes.split(',')]
-                except:
-                    st.error("Please enter valid comma-separated price and volume numbers")
-                    return
-                
-                # Calculate volume analysis
-                volume_ratio, volume_status, delta_status = calculate_volume_analysis(current_volume, vol_history)
-                
-                # Calculate VWAP
-                vwap = calculate_vwap(price_list, vol_list)
-                
-                st.markdown("### 📊 Volume Analysis Results:")
-                
-                # Current volume vs average
-                st.metric(
-                    "Volume Ratio (Current/Average)",
-                    f"{volume_ratio:.2f}x",
-                    delta=f"{volume_status} volume"
-                )
-                
-                # Volume status
-                if volume_status == "HIGH":
-                    st.markdown(
-                        f'<div class="volume-high"><h4>📈 HIGH VOLUME ({volume_status})</h4><p>Significant market interest, potential for trend continuation</p></div>',
-                        unsafe_allow_html=True
-                    )
-                elif volume_status == "LOW":
-                    st.markdown(
-                        f'<div class="volume-low"><h4>📉 LOW VOLUME ({volume_status})</h4><p>Low market interest, potential for consolidation</p></div>',
-                        unsafe_allow_html=True
-                    )
-                else:
-                    st.markdown(
-                        f'<div class="volume-neutral"><h4>⚖️ AVERAGE VOLUME ({volume_status})</h4><p>Normal market activity</p></div>',
-                        unsafe_allow_html=True
-                    )
-                
-                # Volume delta (trend)
-                st.markdown(f"### 📈 Volume Delta: {delta_status}")
-                if delta_status == "INCREASING":
-                    st.success("📈 Volume is increasing - potential for trend acceleration")
-                elif delta_status == "DECREASING":
-                    st.warning("📉 Volume is decreasing - potential for trend exhaustion")
-                else:
-                    st.info("⚖️ Volume is stable - maintaining current trend strength")
-                
-                # VWAP Analysis
-                st.markdown("### 🎯 VWAP Analysis:")
-                st.metric("VWAP (Institutional Level)", f"${vwap:,.2f}")
-                
-                # VWAP vs Current Price (assuming current price is from Market Analysis)
-                current_price = st.session_state.get('current_price', 109550.0)
-                price_vwap_diff = current_price - vwap
-                price_vwap_ratio = (current_price / vwap - 1) * 100
-                
-                st.metric(
-                    "Price vs VWAP",
-                    f"${price_vwap_diff:,.2f}",
-                    delta=f"{price_vwap_ratio:.2f}%"
-                )
-                
-                if current_price > vwap:
-                    st.success(f"✅ PRICE ABOVE VWAP: {price_vwap_ratio:.2f}% - Bullish bias, institutional support below")
-                else:
-                    st.error(f"❌ PRICE BELOW VWAP: {price_vwap_ratio:.2f}% - Bearish bias, institutional resistance above")
-                
-                # Volume Framework Integration
-                st.markdown("### 🎯 Framework Integration:")
-                if volume_status == "HIGH" and delta_status == "INCREASING":
-                    st.info("🚀 HIGH INCREASING VOLUME - Potential for 'Mountain Climb/Drop' - Monitor for breakouts")
-                elif volume_status == "LOW" and delta_status == "DECREASING":
-                    st.warning("⏸️ LOW DECREASING VOLUME - Potential for consolidation - Wait for volume confirmation")
-                
-                st.info("Volume analysis now feeds into your positioning and entry timing decisions")
+        st.markdown(_SIDEBAR_MD)
+    
+    # Navigation
+    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs(["Arbitrage Calculator", "Pressure Gauge", "Market Analysis", "Fibonacci Engine", "Technical Indicators", "Volume Analysis"])
+    
+    with tab1:
+        _render_arbitrage_tab(num_outcomes)
+    
+    with tab2:
+        _render_pressure_tab()
+    
+    with tab3:
+        _render_market_tab()
+    
+    with tab4:
+        _render_fibonacci_tab()
+    
+    with tab5:
+        _render_indicators_tab()
+    
+    with tab6:
+        _render_volume_tab()
     
     # Information section
     with st.expander("📚 Framework Information"):
-        st.markdown("""
-        **TRI-FRAMEWORK OVERVIEW:**
-        
-        1. **TREND (AETOS PROTOCOL)**: Price > MA50 for bullish, else bearish
-        2. **POSITIONING (PRESSURE GAUGE)**: (Long OI - Short OI) / Total OI
-        3. **EXECUTION**: Monitor funding rates and market structure
-        
-        **PRESSURE GAUGE INTERPRETATION:**
-        - > 0.7: EXTREME LONGS (potential bearish squeeze)
-        - < -0.7: EXTREME SHORTS (potential bullish squeeze)  
-        - 0.2 to 0.7: HIGH LONGS (caution)
-        - -0.7 to -0.2: HIGH SHORTS (caution)
-        - -0.2 to 0.2: BALANCED positioning
-        
-        **ALPHA COMPRESSION SPRING:**
-        When price compresses in tight range with extreme positioning, 
-        a break often triggers a squeeze in the opposite direction.
-        
-        **FIBONACCI LEVELS:**
-        - 23.6%, 38.2%, 50%, 61.8%, 78.6% - Key support/resistance levels
-        - Price often reverses at these levels
-        - Multi-timeframe alignment increases probability
-        
-        **DMI (Directional Movement Index):**
-        - PDI: Positive Directional Indicator (uptrend strength)
-        - MDI: Negative Directional Indicator (downtrend strength)
-        - Higher PDI than MDI = Bullish trend strength
-        - Higher MDI than PDI = Bearish trend strength
-        
-        **RSI (Relative Strength Index):**
-        - Overbought: RSI > 70 (potential reversal down)
-        - Oversold: RSI < 30 (potential reversal up)
-        - Neutral: 30-70 (balanced market)
-        
-        **VOLUME ANALYSIS:**
-        - Volume vs MA50: Compare current volume to average
-        - Volume Delta: Trend of increasing/decreasing volume
-        - VWAP: Institutional level identification
-        - High volume with price action = stronger signals
-        """)
+        st.markdown(_FRAMEWORK_INFO_MD)
     
     # Footer
     st.markdown("---")
     st.markdown("*For personal learning and trading education only*")
-    st.markdown(f"*Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*")
+    st.markdown(f"*Last updated: {_now_str()}*")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file